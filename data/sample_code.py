@@ -33,15 +33,19 @@ class Calculator:
     def add(self, a, b):
         """Add two numbers."""
         result = a + b
-        self.history.append(f"{a} + {b} = {result}")
+        self.history.append(("+", a, b, result))
         return result
 
     def multiply(self, a, b):
         """Multiply two numbers."""
         result = a * b
-        self.history.append(f"{a} * {b} = {result}")
+        self.history.append(("*", a, b, result))
         return result
 
+    def format_history(self):
+        """Return the history as readable strings."""
+        return [f"{a} {op} {b} = {result}" for op, a, b, result in self.history]
+
 
 def function_without_docstring(x):
     return x + 1
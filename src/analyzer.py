@@ -9,18 +9,99 @@ Analyzes Python code quality based on multiple metrics:
 """
 
 import ast
+import copy
+import heapq
+import json
+import mmap
 import os
-from typing import Dict, List
-from collections import defaultdict
+from typing import Any, DefaultDict, Deque, Dict, Iterator, List, Optional, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+
+
+# Files at least this large (bytes) are read through mmap
+_MMAP_THRESHOLD = 64 * 1024
+
+# Format of the persistent cache file; bump when results change meaning
+_CACHE_VERSION = 1
+
+# What ast.parse returns for source without any statements
+_EMPTY_MODULE = ast.Module(body=[], type_ignores=[])
+
+# Directory names never searched for Python files
+_SKIPPED_DIRS = frozenset(("__pycache__", "venv", "env"))
+
+# Complexity added by each decision node type (BoolOp is weighted separately)
+_DECISION_WEIGHT = {
+    ast.If: 1,
+    ast.While: 1,
+    ast.For: 1,
+    ast.AsyncFor: 1,
+    ast.Try: 1,
+    ast.With: 1,
+    ast.AsyncWith: 1,
+    ast.ExceptHandler: 1,
+}
+
+
+def _has_docstring(node: Any) -> bool:
+    """
+    Check whether a module, class or function starts with a docstring.
+
+    Same test as ast.get_docstring() but without cleaning the text.
+
+    Args:
+        node: Module, ClassDef or FunctionDef node
+
+    Returns:
+        True if the first statement is a string literal
+    """
+    body = node.body
+    if not body:
+        return False
+    first = body[0]
+    return (
+        type(first) is ast.Expr
+        and type(first.value) is ast.Constant
+        and type(first.value.value) is str
+    )
 
 
 class CodeAnalyzer:
     """Analyzes Python code quality using various metrics."""
 
-    def __init__(self):
-        """Initialize the analyzer."""
+    def __init__(self, kgram_size: int = 3, winnow_window: int = 1, cache_path: Optional[str] = None):
+        """
+        Initialize the analyzer.
+
+        Args:
+            kgram_size: Number of consecutive lines compared for duplication
+            winnow_window: Winnowing window; values above 1 keep only the
+                minimum fingerprint of each window, trading recall on short
+                duplicates for less memory on large files
+            cache_path: Optional JSON file used to keep results between runs
+
+        Raises:
+            ValueError: If kgram_size or winnow_window is less than 1
+        """
+        if kgram_size < 1:
+            raise ValueError(f"kgram_size must be at least 1, got {kgram_size}")
+        if winnow_window < 1:
+            raise ValueError(f"winnow_window must be at least 1, got {winnow_window}")
+
         self.complexity_threshold = 10
         self.duplication_threshold = 0.3
+        self.kgram_size = kgram_size
+        self.winnow_window = winnow_window
+        # Directories with fewer files than this are analyzed serially
+        self.parallel_threshold = 4
+        # Results keyed by (absolute path, mtime in ns, size, *settings)
+        self._cache: Dict[tuple, Dict] = {}
+        self.cache_path = cache_path
+        if cache_path:
+            self._load_cache()
 
     def analyze_file(self, file_path: str) -> Dict:
         """
@@ -32,107 +113,273 @@ class CodeAnalyzer:
         Returns:
             Dictionary with analysis results
         """
-        if not os.path.exists(file_path):
-            return {"error": f"File not found: {file_path}"}
-
+        # A single stat both checks existence and builds the cache key
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                code = f.read()
+            cache_key = self._cache_key(file_path)
+            if cache_key in self._cache:
+                cached = copy.deepcopy(self._cache[cache_key])
+                cached["file_path"] = file_path
+                return cached
+
+            if cache_key[2] >= _MMAP_THRESHOLD:
+                code = self._read_mapped(file_path)
+            else:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    code = f.read()
+        except FileNotFoundError:
+            return {"error": f"File not found: {file_path}"}
         except Exception as e:
             return {"error": f"Error reading file: {str(e)}"}
 
-        try:
-            tree = ast.parse(code)
-        except SyntaxError as e:
-            return {"error": f"Syntax error: {str(e)}"}
+        if code.strip():
+            try:
+                tree = ast.parse(code)
+            except SyntaxError as e:
+                return {"error": f"Syntax error: {str(e)}"}
+        else:
+            # Whitespace-only files (e.g. an empty __init__.py) need no parsing
+            tree = _EMPTY_MODULE
+
+        lines = code.splitlines()
+        metrics = self._walk_once(tree)
 
         results = {
             "file_path": file_path,
-            "pep8_score": self._check_pep8(code),
-            "complexity": self._calculate_complexity(tree),
-            "docstring_coverage": self._check_docstrings(tree),
-            "duplication": self._check_duplication(code),
-            "line_count": len(code.splitlines()),
-            "function_count": len([node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]),
-            "class_count": len([node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]),
+            "pep8_score": self._check_pep8(code, lines),
+            "complexity": metrics["complexity"],
+            "docstring_coverage": metrics["docstring_coverage"],
+            "duplication": self._check_duplication(code, lines),
+            "line_count": len(lines),
+            "function_count": metrics["function_count"],
+            "class_count": metrics["class_count"],
         }
 
         results["overall_score"] = self._calculate_overall_score(results)
         results["recommendations"] = self._generate_recommendations(results)
 
+        # Store a private copy so callers cannot mutate cached results
+        self._cache[cache_key] = copy.deepcopy(results)
         return results
 
-    def _check_pep8(self, code: str) -> float:
+    def __getstate__(self) -> Dict:
+        """Drop the result cache when pickling for worker processes."""
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        return state
+
+    def _load_cache(self):
+        """Load cached results from cache_path, ignoring a missing, bad or stale file."""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data["version"] != _CACHE_VERSION or tuple(data["settings"]) != self._settings():
+                return
+            cache = {tuple(key): result for key, result in data["entries"]}
+        except (OSError, ValueError, TypeError, KeyError):
+            return
+
+        self._cache = cache
+
+    def save_cache(self) -> bool:
+        """
+        Save cached results to cache_path.
+
+        Only the newest entry of each file is kept so the file does not grow
+        with every edit.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.cache_path:
+            return False
+
+        latest: Dict[str, tuple] = {}
+        for key in self._cache:
+            if key[0] not in latest or key[1] > latest[key[0]][1]:
+                latest[key[0]] = key
+
+        data = {
+            "version": _CACHE_VERSION,
+            "settings": list(self._settings()),
+            "entries": [[list(key), self._cache[key]] for key in latest.values()],
+        }
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            return True
+        except (OSError, TypeError, ValueError):
+            return False
+
+    def _settings(self) -> tuple:
+        """
+        Settings that change analysis results.
+
+        Returns:
+            Tuple of complexity threshold, k-gram size and winnowing window
+        """
+        return (self.complexity_threshold, self.kgram_size, self.winnow_window)
+
+    def _cache_key(self, file_path: str) -> tuple:
+        """
+        Build the result cache key for a file.
+
+        The current settings are part of the key, so changing e.g.
+        complexity_threshold after construction never serves stale results.
+
+        Args:
+            file_path: Path to the Python file
+
+        Returns:
+            Tuple of absolute path, modification time (ns), size and settings
+        """
+        stat = os.stat(file_path)
+        return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size) + self._settings()
+
+    def _read_mapped(self, file_path: str) -> str:
+        """
+        Read a large file by decoding straight from a memory mapping.
+
+        Avoids the intermediate bytes copy made by a buffered text read.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Decoded file contents
+        """
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                return str(mapped, "utf-8")
+        finally:
+            os.close(fd)
+
+    def _check_pep8(self, code: str, lines: Optional[List[str]] = None) -> float:
         """
         Check PEP 8 compliance (simplified version).
 
         Args:
             code: Source code as string
+            lines: Pre-split lines of the code (computed if omitted)
 
         Returns:
             PEP 8 compliance score (0-1)
         """
-        lines = code.splitlines()
+        if lines is None:
+            lines = code.splitlines()
         if not lines:
             return 0.0
 
-        violations = 0
-        total_checks = 0
-
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
+        # Non-blank, non-comment lines are checked for length and ';'
+        code_lines: List[str] = [
+            line
+            for line, stripped in zip(lines, map(str.lstrip, lines))
+            if stripped and stripped[0] != "#"
+        ]
 
-            # Check line length (max 79 for code, 72 for comments)
-            if stripped and not stripped.startswith("#"):
-                total_checks += 1
-                if len(line) > 79:
-                    violations += 1
+        long_lines = sum(1 for line in code_lines if len(line) > 79)
+        # Most files contain no ';' at all, so skip the per-line scan
+        multi_statement = sum(1 for line in code_lines if ";" in line) if ";" in code else 0
+        trailing_whitespace = sum(map(str.endswith, lines, repeat((" ", "\t"))))
 
-            # Check for trailing whitespace
-            if line and line[-1] in [" ", "\t"]:
-                violations += 1
-                total_checks += 1
-
-            # Check for multiple statements on one line
-            if ";" in stripped and not stripped.startswith("#"):
-                violations += 1
-                total_checks += 1
+        violations = long_lines + trailing_whitespace + multi_statement
+        total_checks = len(code_lines) + trailing_whitespace + multi_statement
 
         if total_checks == 0:
             return 1.0
 
         return max(0.0, 1.0 - (violations / total_checks))
 
-    def _calculate_complexity(self, tree: ast.AST) -> Dict:
+    def _walk_once(self, tree: ast.AST) -> Dict:
         """
-        Calculate cyclomatic complexity for functions.
+        Collect complexity, docstring and count metrics in a single AST pass.
+
+        Decision nodes are credited to every enclosing function, so nested
+        functions contribute to their parents just like a per-function walk.
 
         Args:
             tree: AST tree of the code
 
         Returns:
-            Dictionary with complexity metrics
+            Dictionary with complexity, docstring_coverage, function_count
+            and class_count entries
         """
-        complexities = []
-        function_complexities = {}
+        names: List[str] = []
+        complexities: List[int] = []
+        functions_with_docstring: int = 0
+        classes_total: int = 0
+        classes_with_docstring: int = 0
+
+        # Breadth-first like ast.walk. Siblings are queued together with the
+        # indices of their enclosing functions rather than one entry per node.
+        todo: Deque[Tuple[Tuple[int, ...], List[Any]]] = deque([((), [tree])])
+        while todo:
+            parent_enclosing, nodes = todo.popleft()
+            for node in nodes:
+                enclosing = parent_enclosing
+                node_type = type(node)
+
+                if node_type is ast.FunctionDef:
+                    enclosing = enclosing + (len(complexities),)
+                    names.append(node.name)
+                    complexities.append(1)  # Base complexity
+                    functions_with_docstring += _has_docstring(node)
+                elif node_type is ast.ClassDef:
+                    classes_total += 1
+                    classes_with_docstring += _has_docstring(node)
+                elif enclosing:
+                    weight = _DECISION_WEIGHT.get(node_type, 0)
+                    if node_type is ast.BoolOp:
+                        weight = len(node.values) - 1
+                    if weight:
+                        for index in enclosing:
+                            complexities[index] += weight
+
+                children = list(ast.iter_child_nodes(node))
+                if children:
+                    todo.append((enclosing, children))
+
+        return self._assemble_metrics(
+            tree, names, complexities, functions_with_docstring, classes_total, classes_with_docstring
+        )
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                complexity = 1  # Base complexity
+    def _assemble_metrics(
+        self,
+        tree: ast.AST,
+        names: List[str],
+        complexities: List[int],
+        functions_with_docstring: int,
+        classes_total: int,
+        classes_with_docstring: int,
+    ) -> Dict:
+        """
+        Build the metric dictionaries from the counters gathered by _walk_once.
 
-                for child in ast.walk(node):
-                    if isinstance(child, (ast.If, ast.While, ast.For, ast.Try, ast.With)):
-                        complexity += 1
-                    elif isinstance(child, ast.BoolOp):
-                        complexity += len(child.values) - 1
-                    elif isinstance(child, ast.ExceptHandler):
-                        complexity += 1
+        Args:
+            tree: AST tree of the code
+            names: Function names, in visiting order
+            complexities: Complexity of each function in names
+            functions_with_docstring: Number of functions with a docstring
+            classes_total: Number of classes
+            classes_with_docstring: Number of classes with a docstring
 
-                complexities.append(complexity)
-                function_complexities[node.name] = complexity
+        Returns:
+            Dictionary with complexity, docstring_coverage, function_count
+            and class_count entries
+        """
+        functions_total = len(complexities)
+        total_items = functions_total + classes_total
+        items_with_docstring = functions_with_docstring + classes_with_docstring
 
-        if not complexities:
-            return {
+        if complexities:
+            complexity = {
+                "average": sum(complexities) / functions_total,
+                "max": max(complexities),
+                "functions": dict(zip(names, complexities)),
+                "high_complexity_count": sum(1 for c in complexities if c > self.complexity_threshold),
+            }
+        else:
+            complexity = {
                 "average": 0,
                 "max": 0,
                 "functions": {},
@@ -140,97 +387,137 @@ class CodeAnalyzer:
             }
 
         return {
-            "average": sum(complexities) / len(complexities),
-            "max": max(complexities),
-            "functions": function_complexities,
-            "high_complexity_count": sum(1 for c in complexities if c > self.complexity_threshold),
+            "complexity": complexity,
+            "docstring_coverage": {
+                "coverage": items_with_docstring / total_items if total_items > 0 else 1.0,
+                "functions_total": functions_total,
+                "functions_with_docstring": functions_with_docstring,
+                "classes_total": classes_total,
+                "classes_with_docstring": classes_with_docstring,
+                "module_has_docstring": _has_docstring(tree),
+            },
+            "function_count": functions_total,
+            "class_count": classes_total,
         }
 
-    def _check_docstrings(self, tree: ast.AST) -> Dict:
+    def _calculate_complexity(self, tree: ast.AST) -> Dict:
         """
-        Check docstring coverage.
+        Calculate cyclomatic complexity for functions.
 
         Args:
             tree: AST tree of the code
 
         Returns:
-            Dictionary with docstring metrics
+            Dictionary with complexity metrics
         """
-        functions = []
-        classes = []
-        modules_with_docstring = ast.get_docstring(tree) is not None
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                functions.append(node)
-            elif isinstance(node, ast.ClassDef):
-                classes.append(node)
-
-        functions_with_docstring = sum(
-            1 for f in functions if ast.get_docstring(f) is not None
-        )
-        classes_with_docstring = sum(
-            1 for c in classes if ast.get_docstring(c) is not None
-        )
+        return self._walk_once(tree)["complexity"]
 
-        total_items = len(functions) + len(classes)
-        items_with_docstring = functions_with_docstring + classes_with_docstring
+    def _check_docstrings(self, tree: ast.AST) -> Dict:
+        """
+        Check docstring coverage.
 
-        coverage = items_with_docstring / total_items if total_items > 0 else 1.0
+        Args:
+            tree: AST tree of the code
 
-        return {
-            "coverage": coverage,
-            "functions_total": len(functions),
-            "functions_with_docstring": functions_with_docstring,
-            "classes_total": len(classes),
-            "classes_with_docstring": classes_with_docstring,
-            "module_has_docstring": modules_with_docstring,
-        }
+        Returns:
+            Dictionary with docstring metrics
+        """
+        return self._walk_once(tree)["docstring_coverage"]
 
-    def _check_duplication(self, code: str) -> Dict:
+    def _check_duplication(self, code: str, lines: Optional[List[str]] = None) -> Dict:
         """
         Check for code duplication (simplified version).
 
         Args:
             code: Source code as string
+            lines: Pre-split lines of the code (computed if omitted)
 
         Returns:
             Dictionary with duplication metrics
         """
-        lines = [line.strip() for line in code.splitlines() if line.strip() and not line.strip().startswith("#")]
+        if lines is None:
+            lines = code.splitlines()
+        lines = [stripped for stripped in map(str.strip, lines) if stripped and stripped[0] != "#"]
 
-        if len(lines) < 4:
+        k = self.kgram_size
+        if len(lines) < k + 1:
             return {"duplication_ratio": 0.0, "duplicate_blocks": []}
 
-        # Check for duplicate sequences of 3+ lines
-        duplicate_blocks = []
-        seen_sequences = defaultdict(list)
-
-        for i in range(len(lines) - 2):
-            sequence = tuple(lines[i : i + 3])
-            seen_sequences[sequence].append(i)
+        # Check for duplicate sequences of k+ lines. Windows are keyed by an
+        # integer fingerprint (str hashes are cached, so each line is hashed
+        # once) and only compared line by line when fingerprints match.
+        hashes: List[int] = list(map(hash, zip(*(lines[j:] for j in range(k)))))
+        fingerprints: DefaultDict[int, List[int]] = defaultdict(list)
+        for i in self._winnow(hashes):
+            fingerprints[hashes[i]].append(i)
 
-        for sequence, positions in seen_sequences.items():
+        seen_sequences: DefaultDict[Tuple[str, ...], List[int]] = defaultdict(list)
+        for positions in fingerprints.values():
             if len(positions) > 1:
-                duplicate_blocks.append({
-                    "sequence": list(sequence),
-                    "occurrences": len(positions),
-                    "positions": positions,
-                })
+                for i in positions:
+                    seen_sequences[tuple(lines[i : i + k])].append(i)
+
+        duplicate_groups: List[Tuple[Tuple[str, ...], List[int]]] = [
+            (sequence, positions)
+            for sequence, positions in seen_sequences.items()
+            if len(positions) > 1
+        ]
 
         total_lines = len(lines)
-        duplicate_lines = sum(
-            len(block["sequence"]) * (block["occurrences"] - 1)
-            for block in duplicate_blocks
-        )
+        duplicate_lines = sum(k * (len(positions) - 1) for _, positions in duplicate_groups)
 
         duplication_ratio = duplicate_lines / total_lines if total_lines > 0 else 0.0
 
+        # Only the first 5 blocks (by first occurrence) are reported
+        duplicate_blocks = [
+            {
+                "sequence": list(sequence),
+                "occurrences": len(positions),
+                "positions": positions,
+            }
+            for sequence, positions in heapq.nsmallest(5, duplicate_groups, key=lambda x: x[1][0])
+        ]
+
         return {
             "duplication_ratio": duplication_ratio,
-            "duplicate_blocks": duplicate_blocks[:5],  # Limit to first 5
+            "duplicate_blocks": duplicate_blocks,
         }
 
+    def _winnow(self, hashes: List[int]) -> List[int]:
+        """
+        Select fingerprint positions using winnowing.
+
+        Keeps the rightmost minimum hash of every run of winnow_window
+        consecutive hashes, so any duplicate of at least
+        kgram_size + winnow_window - 1 lines shares a selected fingerprint.
+
+        Args:
+            hashes: Fingerprint of every k-gram window, in order
+
+        Returns:
+            Sorted list of selected window positions
+        """
+        w = self.winnow_window
+        if w <= 1:
+            return list(range(len(hashes)))
+
+        selected: List[int] = []
+        window: Deque[int] = deque()  # Positions with strictly increasing hashes
+        for i, h in enumerate(hashes):
+            while window and hashes[window[-1]] >= h:
+                window.pop()
+            window.append(i)
+            if window[0] <= i - w:
+                window.popleft()
+            if i >= w - 1 and (not selected or selected[-1] != window[0]):
+                selected.append(window[0])
+
+        if not selected and window:
+            # Fewer windows than w: keep the overall minimum
+            selected.append(window[0])
+
+        return selected
+
     def _calculate_overall_score(self, results: Dict) -> float:
         """
         Calculate overall quality score.
@@ -312,6 +599,103 @@ class CodeAnalyzer:
 
         return recommendations
 
+    def _iter_python_files(self, directory: str) -> Iterator[str]:
+        """
+        Yield Python files under a directory in os.walk (top-down) order.
+
+        Uses os.scandir directly so entries are classified from cached
+        directory data without building per-directory lists.
+
+        Args:
+            directory: Root directory to search
+
+        Returns:
+            Iterator over paths of Python files
+        """
+        stack = [directory]
+        while stack:
+            path = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+
+                        if is_dir:
+                            # Skip hidden directories, common ignore patterns
+                            # and symlinked directories (as os.walk does)
+                            if not name.startswith(".") and name not in _SKIPPED_DIRS and not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif name.endswith(".py") and not name.startswith("."):
+                            yield entry.path
+            except OSError:
+                continue
+
+            stack.extend(reversed(subdirs))
+
+    def _analyze_files(self, python_files: List[str]) -> List[Dict]:
+        """
+        Analyze several files, spreading uncached ones over worker processes.
+
+        Args:
+            python_files: Paths to the Python files to analyze
+
+        Returns:
+            List of analysis results in the same order as python_files
+        """
+        if len(python_files) < self.parallel_threshold:
+            return [self.analyze_file(file_path) for file_path in python_files]
+
+        results: Dict[str, Dict] = {}
+        pending: List[Tuple[str, Optional[tuple]]] = []
+        for file_path in python_files:
+            try:
+                cache_key = self._cache_key(file_path)
+            except OSError:
+                cache_key = None
+            if cache_key in self._cache:
+                results[file_path] = self.analyze_file(file_path)
+            else:
+                pending.append((file_path, cache_key))
+
+        if pending:
+            analyzed = self._analyze_in_workers([file_path for file_path, _ in pending])
+            for (file_path, cache_key), result in zip(pending, analyzed):
+                if cache_key is not None and "error" not in result:
+                    self._cache[cache_key] = copy.deepcopy(result)
+                results[file_path] = result
+
+        return [results[file_path] for file_path in python_files]
+
+    def _analyze_in_workers(self, file_paths: List[str]) -> List[Dict]:
+        """
+        Analyze files in worker processes, falling back to serial analysis.
+
+        Args:
+            file_paths: Paths to the Python files to analyze
+
+        Returns:
+            List of analysis results in the same order as file_paths
+        """
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        try:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        except (OSError, NotImplementedError):
+            # No worker processes on this platform (e.g. no sem_open)
+            return [self.analyze_file(file_path) for file_path in file_paths]
+
+        try:
+            with executor:
+                return list(executor.map(self.analyze_file, file_paths, chunksize=8))
+        except BrokenProcessPool:
+            # Workers died (e.g. a spawn start without a __main__ guard);
+            # errors raised by analyze_file itself still propagate
+            return [self.analyze_file(file_path) for file_path in file_paths]
+
     def analyze_directory(self, directory: str) -> Dict:
         """
         Analyze all Python files in a directory.
@@ -325,23 +709,14 @@ class CodeAnalyzer:
         if not os.path.isdir(directory):
             return {"error": f"Directory not found: {directory}"}
 
-        python_files = []
-        for root, dirs, files in os.walk(directory):
-            # Skip hidden directories and common ignore patterns
-            dirs[:] = [d for d in dirs if not d.startswith(".") and d not in ["__pycache__", "venv", "env"]]
-
-            for file in files:
-                if file.endswith(".py") and not file.startswith("."):
-                    python_files.append(os.path.join(root, file))
+        python_files = list(self._iter_python_files(directory))
 
         if not python_files:
             return {"error": "No Python files found in directory"}
 
-        file_results = []
-        for file_path in python_files:
-            result = self.analyze_file(file_path)
-            if "error" not in result:
-                file_results.append(result)
+        file_results = [
+            result for result in self._analyze_files(python_files) if "error" not in result
+        ]
 
         if not file_results:
             return {"error": "No valid Python files could be analyzed"}
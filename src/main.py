@@ -13,6 +13,14 @@ from src.analyzer import CodeAnalyzer
 from src.reporter import ReportGenerator
 
 
+def _save_cache(analyzer, cache_path):
+    """Save the analyzer's result cache; a failed write only warns."""
+    if analyzer.save_cache():
+        print(f"Cache saved to: {cache_path}", file=sys.stderr)
+    else:
+        print(f"Warning: could not save cache to: {cache_path}", file=sys.stderr)
+
+
 def main():
     """Main function to run the code quality assessment tool."""
     parser = argparse.ArgumentParser(
@@ -38,6 +46,13 @@ def main():
         default="text",
         help="Report format (default: text)",
     )
+    parser.add_argument(
+        "--cache",
+        "-c",
+        type=str,
+        default=None,
+        help="JSON file for caching results of unchanged files between runs",
+    )
 
     args = parser.parse_args()
 
@@ -47,7 +62,7 @@ def main():
         sys.exit(1)
 
     # Initialize analyzer and reporter
-    analyzer = CodeAnalyzer()
+    analyzer = CodeAnalyzer(cache_path=args.cache)
     reporter = ReportGenerator()
 
     # Analyze
@@ -66,7 +81,11 @@ def main():
         print(f"Error: {results['error']}", file=sys.stderr)
         sys.exit(1)
 
+    if args.cache:
+        _save_cache(analyzer, args.cache)
+
     # Generate and output report
+    reporter.begin()
     if args.format == "json":
         report = reporter.generate_json_report(results)
     else:
@@ -85,7 +104,8 @@ def main():
     # Print summary
     summary = reporter.generate_summary(results)
     if "error" not in summary:
-        print(f"\nSummary: {summary['grade']} ({summary.get('score', summary.get('average_score', 'N/A'))}/100)", file=sys.stderr)
+        grade = summary.get("grade", summary.get("average_grade"))
+        print(f"\nSummary: {grade} ({summary.get('score', summary.get('average_score', 'N/A'))}/100)", file=sys.stderr)
 
 
 if __name__ == "__main__":
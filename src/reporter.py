@@ -4,17 +4,48 @@ Report Generator
 Generates reports from code analysis results.
 """
 
+import bisect
+import heapq
 import json
 from typing import Dict, List
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+
+# Lower score bounds of grades D, C, B and A; anything below is F
+_GRADE_THRESHOLDS = (60, 70, 80, 90)
+_GRADES = (
+    "F (Poor)",
+    "D (Needs Improvement)",
+    "C (Satisfactory)",
+    "B (Good)",
+    "A (Excellent)",
+)
+
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+
+def _encode_json(results: Dict) -> bytes:
+    """Encode results as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(results, option=_ORJSON_OPTIONS)
+    return json.dumps(results, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 class ReportGenerator:
     """Generates various types of reports from analysis results."""
 
     def __init__(self):
         """Initialize the report generator."""
-        pass
+        self._now = None
+
+    def begin(self):
+        """Fix the report timestamp so every report of a run shares it."""
+        self._now = datetime.now()
 
     def generate_text_report(self, results: Dict) -> str:
         """
@@ -33,7 +64,7 @@ class ReportGenerator:
         report.append("=" * 80)
         report.append("CODE QUALITY ASSESSMENT REPORT")
         report.append("=" * 80)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        report.append(f"Generated: {(self._now or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')}\n")
 
         if "file_path" in results:
             # Single file report
@@ -52,11 +83,11 @@ class ReportGenerator:
 
             if results['complexity']['functions']:
                 report.append("FUNCTION COMPLEXITY:")
-                for func_name, complexity in sorted(
+                for func_name, complexity in heapq.nlargest(
+                    5,
                     results['complexity']['functions'].items(),
                     key=lambda x: x[1],
-                    reverse=True
-                )[:5]:
+                ):
                     report.append(f"  {func_name}: {complexity}")
 
             report.append("\nRECOMMENDATIONS:")
@@ -91,7 +122,7 @@ class ReportGenerator:
         Returns:
             JSON string
         """
-        return json.dumps(results, indent=2, ensure_ascii=False)
+        return _encode_json(results).decode("utf-8")
 
     def generate_summary(self, results: Dict) -> Dict:
         """
@@ -111,7 +142,7 @@ class ReportGenerator:
                 "file": results["file_path"],
                 "score": results["overall_score"],
                 "grade": self._score_to_grade(results["overall_score"]),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": (self._now or datetime.now()).isoformat(),
             }
         elif "directory" in results:
             return {
@@ -119,7 +150,7 @@ class ReportGenerator:
                 "files_analyzed": results["files_analyzed"],
                 "average_score": results["average_score"],
                 "average_grade": self._score_to_grade(results["average_score"]),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": (self._now or datetime.now()).isoformat(),
             }
 
         return {"error": "Unknown results format"}
@@ -134,16 +165,7 @@ class ReportGenerator:
         Returns:
             Letter grade
         """
-        if score >= 90:
-            return "A (Excellent)"
-        elif score >= 80:
-            return "B (Good)"
-        elif score >= 70:
-            return "C (Satisfactory)"
-        elif score >= 60:
-            return "D (Needs Improvement)"
-        else:
-            return "F (Poor)"
+        return _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, score)]
 
     def save_report(self, results: Dict, output_path: str, format: str = "text") -> bool:
         """
@@ -159,9 +181,12 @@ class ReportGenerator:
         """
         try:
             if format == "json":
-                content = self.generate_json_report(results)
-            else:
-                content = self.generate_text_report(results)
+                # Write the encoded bytes directly, skipping a decode
+                with open(output_path, "wb") as f:
+                    f.write(_encode_json(results))
+                return True
+
+            content = self.generate_text_report(results)
 
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(content)
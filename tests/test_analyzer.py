@@ -195,3 +195,272 @@ def func2():
         assert len(good_recs) > 0
         assert len(bad_recs) > len(good_recs)
 
+    def test_walk_once_nested_functions(self):
+        """Test that nested branches count towards every enclosing function."""
+        import ast
+
+        code = '''class Outer:
+    """Outer class."""
+
+    def method(self, x):
+        def inner(y):
+            if y and x:
+                return y
+            return x
+        return inner(x)
+'''
+
+        result = self.analyzer._walk_once(ast.parse(code))
+
+        assert result["function_count"] == 2
+        assert result["class_count"] == 1
+        assert result["complexity"]["functions"] == {"method": 3, "inner": 3}
+        assert result["docstring_coverage"]["classes_with_docstring"] == 1
+        assert result["docstring_coverage"]["functions_with_docstring"] == 0
+
+    def test_duplication_winnowing(self):
+        """Test that winnowing still reports a duplicate of kgram_size + winnow_window - 1 lines."""
+        analyzer = CodeAnalyzer(kgram_size=3, winnow_window=4)
+        block = [f"v{i} = {i}" for i in range(3 + 4 - 1)]
+        body = "".join(f"    {line}\n" for line in block)
+        code = f"def func1():\n{body}    return 1\n\ndef func2():\n{body}    return 2\n"
+
+        result = analyzer._check_duplication(code)
+
+        assert result["duplicate_blocks"]
+        for duplicate in result["duplicate_blocks"]:
+            assert duplicate["occurrences"] == 2
+            assert duplicate["sequence"] in [block[i:i + 3] for i in range(len(block) - 2)]
+            # The second copy starts len(block) + 2 code lines after the first
+            assert duplicate["positions"][1] - duplicate["positions"][0] == len(block) + 2
+
+    @pytest.mark.parametrize("kwargs", [{"kgram_size": 0}, {"winnow_window": 0}])
+    def test_invalid_duplication_settings(self, kwargs):
+        """Test that non-positive duplication settings are rejected."""
+        with pytest.raises(ValueError):
+            CodeAnalyzer(**kwargs)
+
+    def test_complexity_async_statements(self):
+        """Test that async loops and context managers add complexity."""
+        import ast
+
+        code = """def runner(items):
+    async def consume(stream, lock):
+        async with lock:
+            async for item in stream:
+                items.append(item)
+    return consume
+"""
+
+        result = self.analyzer._calculate_complexity(ast.parse(code))
+        assert result["functions"] == {"runner": 3}
+
+    def test_analyze_file_cache(self):
+        """Test that unchanged files are served from the cache."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write("def one():\n    return 1\n")
+            temp_path = f.name
+
+        try:
+            first = self.analyzer.analyze_file(temp_path)
+            assert self.analyzer.analyze_file(temp_path) == first
+            assert len(self.analyzer._cache) == 1
+
+            with open(temp_path, "a", encoding="utf-8") as f:
+                f.write("\n\ndef two():\n    return 2\n")
+
+            second = self.analyzer.analyze_file(temp_path)
+            assert second["function_count"] == 2
+            assert len(self.analyzer._cache) == 2
+        finally:
+            os.unlink(temp_path)
+
+    def test_analyze_directory_parallel(self):
+        """Test directory analysis across worker processes."""
+        with tempfile.TemporaryDirectory() as directory:
+            for i in range(5):
+                with open(os.path.join(directory, f"mod{i}.py"), "w", encoding="utf-8") as f:
+                    f.write(f'"""Module {i}."""\n\n\ndef func{i}():\n    """Return {i}."""\n    return {i}\n')
+            with open(os.path.join(directory, "broken.py"), "w", encoding="utf-8") as f:
+                f.write("def invalid syntax here")
+
+            result = self.analyzer.analyze_directory(directory)
+            assert result["files_analyzed"] == 5
+            assert len(self.analyzer._cache) == 5
+
+            serial = CodeAnalyzer()
+            serial.parallel_threshold = 100
+            expected = serial.analyze_directory(directory)
+            assert sorted(r["overall_score"] for r in result["file_results"]) == sorted(
+                r["overall_score"] for r in expected["file_results"]
+            )
+
+    def test_analyze_large_file(self):
+        """Test analysis of a file large enough to be memory-mapped."""
+        body = "".join(f"def func{i}():\n    return {i}\n\n\n" for i in range(3000))
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write(body)
+            temp_path = f.name
+
+        try:
+            assert os.path.getsize(temp_path) >= 64 * 1024
+            result = self.analyzer.analyze_file(temp_path)
+            assert "error" not in result
+            assert result["function_count"] == 3000
+            assert result["line_count"] == len(body.splitlines())
+        finally:
+            os.unlink(temp_path)
+
+    def test_persistent_cache(self):
+        """Test that results survive between analyzer instances via cache_path."""
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "mod.py")
+            cache_path = os.path.join(directory, "cache.json")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write('"""Module."""\n\n\ndef func():\n    """Return 1."""\n    return 1\n')
+
+            first = CodeAnalyzer(cache_path=cache_path)
+            expected = first.analyze_file(source)
+            assert first.save_cache()
+
+            second = CodeAnalyzer(cache_path=cache_path)
+            assert len(second._cache) == 1
+            assert second.analyze_file(source) == expected
+
+    def test_analyze_whitespace_only_file(self, monkeypatch):
+        """Test that whitespace-only files skip parsing but match the full pipeline."""
+        import src.analyzer
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            blank_path = os.path.join(temp_dir, "blank.py")
+            comment_path = os.path.join(temp_dir, "comment.py")
+            with open(blank_path, "w") as f:
+                f.write("\n\n")
+            # Comment lines are parsed but count like blank ones everywhere
+            with open(comment_path, "w") as f:
+                f.write("#\n#\n")
+            expected = self.analyzer.analyze_file(comment_path)
+
+            def fail_parse(code):
+                raise AssertionError("ast.parse called for a whitespace-only file")
+
+            monkeypatch.setattr(src.analyzer.ast, "parse", fail_parse)
+            result = self.analyzer.analyze_file(blank_path)
+
+        expected["file_path"] = blank_path
+        assert result == expected
+
+    def test_analyze_comment_only_file(self):
+        """Test a file with comments but no statements."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write("# Package marker\n")
+            temp_path = f.name
+
+        try:
+            result = self.analyzer.analyze_file(temp_path)
+            assert "error" not in result
+            assert result["function_count"] == 0
+            assert result["class_count"] == 0
+            assert result["docstring_coverage"]["coverage"] == 1.0
+            assert result["duplication"]["duplication_ratio"] == 0.0
+        finally:
+            os.unlink(temp_path)
+
+    def test_analyze_directory_without_process_pool(self, monkeypatch):
+        """Test that directory analysis falls back to serial when no pool can start."""
+        import src.analyzer
+
+        def broken_pool(*args, **kwargs):
+            raise OSError("sem_open is not available")
+
+        monkeypatch.setattr(src.analyzer, "ProcessPoolExecutor", broken_pool)
+
+        with tempfile.TemporaryDirectory() as directory:
+            for i in range(5):
+                with open(os.path.join(directory, f"mod{i}.py"), "w", encoding="utf-8") as f:
+                    f.write(f"def func{i}():\n    return {i}\n")
+
+            result = self.analyzer.analyze_directory(directory)
+            assert result["files_analyzed"] == 5
+            assert len(self.analyzer._cache) == 5
+
+    def test_analyze_directory_worker_error_propagates(self, monkeypatch):
+        """Test that an error from analyze_file in a worker is not retried serially."""
+        import src.analyzer
+
+        class FailingPool:
+            def __init__(self, max_workers):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def map(self, func, iterable, chunksize=1):
+                raise RecursionError("maximum recursion depth exceeded")
+
+        monkeypatch.setattr(src.analyzer, "ProcessPoolExecutor", FailingPool)
+
+        with tempfile.TemporaryDirectory() as directory:
+            for i in range(5):
+                with open(os.path.join(directory, f"mod{i}.py"), "w", encoding="utf-8") as f:
+                    f.write(f"def func{i}():\n    return {i}\n")
+
+            with pytest.raises(RecursionError):
+                self.analyzer.analyze_directory(directory)
+            assert self.analyzer._cache == {}
+
+    def test_analyze_file_cache_isolation(self):
+        """Test that settings changes and caller mutations do not leak into cached results."""
+        code = "def branchy(x):\n" + "".join(f"    if x == {i}:\n        return {i}\n" for i in range(11))
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write(code)
+            temp_path = f.name
+
+        try:
+            first = self.analyzer.analyze_file(temp_path)
+            assert first["complexity"]["high_complexity_count"] == 1
+
+            first["complexity"]["functions"].clear()
+            first["recommendations"].append("mutated")
+            again = self.analyzer.analyze_file(temp_path)
+            assert again["complexity"]["functions"] == {"branchy": 12}
+            assert "mutated" not in again["recommendations"]
+
+            self.analyzer.complexity_threshold = 15
+            assert self.analyzer.analyze_file(temp_path)["complexity"]["high_complexity_count"] == 0
+        finally:
+            os.unlink(temp_path)
+
+    def test_persistent_cache_rejects_stale_file(self):
+        """Test that cache files from another version or other settings are ignored."""
+        import json
+        from src.analyzer import _CACHE_VERSION
+
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "mod.py")
+            cache_path = os.path.join(directory, "cache.json")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write("def func():\n    return 1\n")
+
+            analyzer = CodeAnalyzer(cache_path=cache_path)
+            analyzer.analyze_file(source)
+            assert analyzer.save_cache()
+
+            assert len(CodeAnalyzer(kgram_size=4, cache_path=cache_path)._cache) == 0
+
+            with open(cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            data["version"] = -1
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            assert len(CodeAnalyzer(cache_path=cache_path)._cache) == 0
+
+            # A malformed entry discards the whole file, not just the tail
+            data["version"] = _CACHE_VERSION
+            data["entries"].append(["not", "a", "pair"])
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            assert len(CodeAnalyzer(cache_path=cache_path)._cache) == 0
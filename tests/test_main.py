@@ -0,0 +1,43 @@
+"""Tests for the command-line entry point."""
+
+import os
+import sys
+
+from src.main import main
+
+
+class TestMain:
+    """Test cases for main()."""
+
+    def _run(self, monkeypatch, *argv):
+        """Run main() with the given command-line arguments."""
+        monkeypatch.setattr(sys, "argv", ["src.main", *argv])
+        main()
+
+    def _write_package(self, directory):
+        """Create a small package of Python files in directory."""
+        for name in ("a.py", "b.py"):
+            with open(os.path.join(directory, name), "w") as f:
+                f.write(f'"""Module {name}."""\n\n\ndef f():\n    """Doc."""\n    return 1\n')
+
+    def test_directory_with_cache(self, monkeypatch, tmp_path, capsys):
+        """Test that a directory run saves the cache."""
+        self._write_package(tmp_path)
+        cache_path = tmp_path / "cache.json"
+
+        self._run(monkeypatch, str(tmp_path), "--cache", str(cache_path))
+
+        assert cache_path.exists()
+        assert "Cache saved to" in capsys.readouterr().err
+
+    def test_unwritable_cache_only_warns(self, monkeypatch, tmp_path, capsys):
+        """Test that failing to save the cache does not fail the run."""
+        self._write_package(tmp_path)
+        cache_path = tmp_path / "missing" / "cache.json"
+
+        self._run(monkeypatch, str(tmp_path), "--cache", str(cache_path), "--format", "json")
+
+        captured = capsys.readouterr()
+        assert not cache_path.exists()
+        assert "Warning: could not save cache" in captured.err
+        assert captured.out.startswith("{")
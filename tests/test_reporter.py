@@ -1,52 +1,70 @@
 """Tests for ReportGenerator class."""
 
-import pytest
-import tempfile
+import json
 import os
+import pytest
+from types import MappingProxyType
+from src.analyzer import CodeAnalyzer
 from src.reporter import ReportGenerator
 
+_SAMPLE_CODE = os.path.join(os.path.dirname(__file__), "..", "data", "sample_code.py")
+
+# Read-only report input shared by the text report tests
+_SINGLE_FILE_RESULTS = MappingProxyType({
+    "file_path": "test.py",
+    "overall_score": 85.5,
+    "pep8_score": 0.9,
+    "complexity": {
+        "average": 4.5,
+        "max": 8,
+        "functions": {"func1": 3, "func2": 8},
+        "high_complexity_count": 1,
+    },
+    "docstring_coverage": {
+        "coverage": 0.8,
+        "functions_total": 2,
+        "functions_with_docstring": 2,
+        "classes_total": 1,
+        "classes_with_docstring": 0,
+        "module_has_docstring": True,
+    },
+    "duplication": {"duplication_ratio": 0.1},
+    "line_count": 50,
+    "function_count": 2,
+    "class_count": 1,
+    "recommendations": ["Add docstrings", "Reduce complexity"],
+})
+
+
+@pytest.fixture(scope="class")
+def reporter():
+    """Shared ReportGenerator for the test class."""
+    return ReportGenerator()
+
+
+@pytest.fixture(scope="class")
+def rendered_single():
+    """Text report for _SINGLE_FILE_RESULTS, rendered once per class."""
+    return ReportGenerator().generate_text_report(_SINGLE_FILE_RESULTS)
+
+
+def _without_timestamp(report):
+    """Drop the 'Generated:' line so reports rendered at different times compare equal."""
+    return [line for line in report.splitlines() if not line.startswith("Generated:")]
+
 
 class TestReportGenerator:
     """Test cases for ReportGenerator."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.reporter = ReportGenerator()
-
-    def test_generate_text_report_single_file(self):
+    def test_generate_text_report_single_file(self, rendered_single):
         """Test text report generation for single file."""
-        results = {
-            "file_path": "test.py",
-            "overall_score": 85.5,
-            "pep8_score": 0.9,
-            "complexity": {
-                "average": 4.5,
-                "max": 8,
-                "functions": {"func1": 3, "func2": 8},
-                "high_complexity_count": 1,
-            },
-            "docstring_coverage": {
-                "coverage": 0.8,
-                "functions_total": 2,
-                "functions_with_docstring": 2,
-                "classes_total": 1,
-                "classes_with_docstring": 0,
-                "module_has_docstring": True,
-            },
-            "duplication": {"duplication_ratio": 0.1},
-            "line_count": 50,
-            "function_count": 2,
-            "class_count": 1,
-            "recommendations": ["Add docstrings", "Reduce complexity"],
-        }
-
-        report = self.reporter.generate_text_report(results)
+        report = rendered_single
         assert "CODE QUALITY ASSESSMENT REPORT" in report
         assert "test.py" in report
         assert "85.5" in report
         assert "RECOMMENDATIONS" in report
 
-    def test_generate_text_report_directory(self):
+    def test_generate_text_report_directory(self, reporter):
         """Test text report generation for directory."""
         results = {
             "directory": "/path/to/code",
@@ -58,34 +76,42 @@ class TestReportGenerator:
             ],
         }
 
-        report = self.reporter.generate_text_report(results)
+        report = reporter.generate_text_report(results)
         assert "Directory:" in report
         assert "3" in report
         assert "75.0" in report
 
-    def test_generate_json_report(self):
+    def test_generate_json_report(self, reporter):
         """Test JSON report generation."""
         results = {"file_path": "test.py", "overall_score": 85.5}
 
-        report = self.reporter.generate_json_report(results)
+        report = reporter.generate_json_report(results)
         assert isinstance(report, str)
         assert "test.py" in report
         assert "85.5" in report
 
-    def test_generate_summary_single_file(self):
+    def test_json_report_matches_stdlib(self, reporter):
+        """Test that the orjson encoder produces the same report as json.dumps."""
+        pytest.importorskip("orjson")
+        results = CodeAnalyzer().analyze_file(_SAMPLE_CODE)
+
+        report = reporter.generate_json_report(results)
+        assert report == json.dumps(results, indent=2, ensure_ascii=False)
+
+    def test_generate_summary_single_file(self, reporter):
         """Test summary generation for single file."""
         results = {
             "file_path": "test.py",
             "overall_score": 85.5,
         }
 
-        summary = self.reporter.generate_summary(results)
+        summary = reporter.generate_summary(results)
         assert "file" in summary
         assert "score" in summary
         assert "grade" in summary
         assert summary["score"] == 85.5
 
-    def test_generate_summary_directory(self):
+    def test_generate_summary_directory(self, reporter):
         """Test summary generation for directory."""
         results = {
             "directory": "/path/to/code",
@@ -93,65 +119,50 @@ class TestReportGenerator:
             "average_score": 75.0,
         }
 
-        summary = self.reporter.generate_summary(results)
+        summary = reporter.generate_summary(results)
         assert "directory" in summary
         assert "average_score" in summary
         assert "average_grade" in summary
 
-    def test_score_to_grade(self):
+    @pytest.mark.parametrize(
+        "score,expected",
+        [(95, "A"), (85, "B"), (75, "C"), (65, "D"), (50, "F")],
+    )
+    def test_score_to_grade(self, reporter, score, expected):
         """Test score to grade conversion."""
-        assert "A" in self.reporter._score_to_grade(95)
-        assert "B" in self.reporter._score_to_grade(85)
-        assert "C" in self.reporter._score_to_grade(75)
-        assert "D" in self.reporter._score_to_grade(65)
-        assert "F" in self.reporter._score_to_grade(50)
+        assert expected in reporter._score_to_grade(score)
 
-    def test_save_report_text(self):
+    def test_save_report_text(self, reporter, rendered_single, tmp_path):
         """Test saving text report to file."""
-        results = {
-            "file_path": "test.py",
-            "overall_score": 85.5,
-            "pep8_score": 0.9,
-            "complexity": {"average": 4.5, "max": 8, "functions": {}, "high_complexity_count": 0},
-            "docstring_coverage": {"coverage": 0.8},
-            "duplication": {"duplication_ratio": 0.1},
-            "line_count": 50,
-            "function_count": 2,
-            "class_count": 1,
-            "recommendations": [],
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            temp_path = f.name
+        temp_path = tmp_path / "report.txt"
 
-        try:
-            success = self.reporter.save_report(results, temp_path, "text")
-            assert success
-            assert os.path.exists(temp_path)
+        success = reporter.save_report(_SINGLE_FILE_RESULTS, temp_path, "text")
+        assert success
+        assert temp_path.exists()
 
-            with open(temp_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                assert "CODE QUALITY ASSESSMENT REPORT" in content
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        content = temp_path.read_bytes()
+        assert b"CODE QUALITY ASSESSMENT REPORT" in content
+        assert _without_timestamp(content.decode("utf-8")) == _without_timestamp(rendered_single)
 
-    def test_save_report_json(self):
+    def test_save_report_json(self, reporter, tmp_path):
         """Test saving JSON report to file."""
         results = {"file_path": "test.py", "overall_score": 85.5}
+        temp_path = tmp_path / "report.json"
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-            temp_path = f.name
+        success = reporter.save_report(results, temp_path, "json")
+        assert success
+        assert temp_path.exists()
 
-        try:
-            success = self.reporter.save_report(results, temp_path, "json")
-            assert success
-            assert os.path.exists(temp_path)
+        content = temp_path.read_bytes()
+        assert b"test.py" in content
+
+    def test_begin_fixes_timestamp(self):
+        """Test that begin() pins the timestamp used by every report."""
+        results = {"file_path": "test.py", "overall_score": 85.5}
+        reporter = ReportGenerator()  # begin() mutates state; keep it local
 
-            with open(temp_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                assert "test.py" in content
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        reporter.begin()
+        first = reporter.generate_summary(results)
+        second = reporter.generate_summary(results)
 
+        assert first["timestamp"] == second["timestamp"] == reporter._now.isoformat()